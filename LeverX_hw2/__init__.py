@@ -2,17 +2,9 @@ __version__ = "1.2.0"
 __author__ = "Student Room Manager Team"
 __description__ = "Combine student and room data with flexible output formats"
 
-from .services.room_student_service import RoomStudentService
-from .data.loaders.loader_factory import DataLoaderFactory
-from .data.exporters.exporter_factory import DataExporterFactory
-from .cli.cli_controller import CLIController
-from .models.student import Student
-from .models.room import Room
-from .models.combined_room import CombinedRoom
-
 __all__ = [
     'RoomStudentService',
-    'DataLoaderFactory', 
+    'DataLoaderFactory',
     'DataExporterFactory',
     'CLIController',
     'Student',
@@ -20,3 +12,31 @@ __all__ = [
     'CombinedRoom',
     '__version__'
 ]
+
+# Public names are resolved on first access so that importing the package
+# (e.g. to read __version__) does not load the whole application stack.
+_LAZY = {
+    'RoomStudentService': ('LeverX_hw2.services.room_student_service', 'RoomStudentService'),
+    'DataLoaderFactory': ('LeverX_hw2.data.loaders.loader_factory', 'DataLoaderFactory'),
+    'DataExporterFactory': ('LeverX_hw2.data.exporters.exporter_factory', 'DataExporterFactory'),
+    'CLIController': ('LeverX_hw2.cli.cli_controller', 'CLIController'),
+    'Student': ('LeverX_hw2.models.student', 'Student'),
+    'Room': ('LeverX_hw2.models.room', 'Room'),
+    'CombinedRoom': ('LeverX_hw2.models.combined_room', 'CombinedRoom'),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    import importlib
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,10 @@
 """Command line argument parsing."""
 import argparse
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
 from .cli_config import CLIConfig
-from ..data.exporters.exporter_factory import DataExporterFactory
 
 
 @dataclass
@@ -23,69 +23,85 @@ class ArgumentParser:
     
     def __init__(self, config: CLIConfig = None):
         self.config = config or CLIConfig()
-        self.parser = self._create_parser()
+    
+    @cached_property
+    def parser(self) -> argparse.ArgumentParser:
+        """Argument parser, built from the argument specs on first use."""
+        return self._create_parser()
     
     def _create_parser(self) -> argparse.ArgumentParser:
         """Create and configure the argument parser."""
+        output_formats = self._format_choices()
         parser = argparse.ArgumentParser(
             prog=self.config.PROGRAM_NAME,
             description=self.config.PROGRAM_DESCRIPTION,
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=self._get_epilog()
-        )
-        
-        # Version argument
-        parser.add_argument(
-            '--version',
-            action='version',
-            version=f'{self.config.PROGRAM_NAME} {self.config.PROGRAM_VERSION}'
-        )
-        
-        # Required arguments
-        parser.add_argument(
-            '--students',
-            required=True,
-            metavar='FILE',
-            help=self.config.STUDENTS_HELP
+            epilog=self._get_epilog(output_formats)
         )
         
-        parser.add_argument(
-            '--rooms',
-            required=True,
-            metavar='FILE',
-            help=self.config.ROOMS_HELP
-        )
+        for flags, options in self._get_argument_specs(output_formats):
+            parser.add_argument(*flags, **options)
         
-        # Optional arguments
-        parser.add_argument(
-            '--out',
-            default=self.config.DEFAULT_OUTPUT_FILE,
-            metavar='FILE',
-            help=self.config.OUTPUT_HELP
-        )
-        
-        parser.add_argument(
-            '--format',
-            default=self.config.DEFAULT_OUTPUT_FORMAT,
-            choices=DataExporterFactory.get_supported_formats(),
-            help=self.config.FORMAT_HELP
-        )
-        
-        # Logging arguments
-        parser.add_argument(
-            '-v', '--verbose',
-            action='store_true',
-            help='Enable verbose output'
-        )
-        
-        parser.add_argument(
-            '-q', '--quiet',
-            action='store_true',
-            help='Suppress non-error output'
-        )
+        # Logging arguments; argparse rejects --verbose together with --quiet
+        logging_group = parser.add_mutually_exclusive_group()
+        for flags, options in self._get_logging_argument_specs():
+            logging_group.add_argument(*flags, **options)
         
         return parser
     
+    def _get_argument_specs(self, output_formats: Tuple[str, ...]) -> List[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+        """Get (flags, options) pairs for the general arguments."""
+        return [
+            # Version argument
+            (self.config.VERSION_FLAGS, {
+                'action': 'version',
+                'version': f'{self.config.PROGRAM_NAME} {self.config.PROGRAM_VERSION}'
+            }),
+            
+            # Required arguments
+            (('--students',), {
+                'required': True,
+                'metavar': 'FILE',
+                'help': self.config.STUDENTS_HELP
+            }),
+            (('--rooms',), {
+                'required': True,
+                'metavar': 'FILE',
+                'help': self.config.ROOMS_HELP
+            }),
+            
+            # Optional arguments
+            (('--out',), {
+                'default': self.config.DEFAULT_OUTPUT_FILE,
+                'metavar': 'FILE',
+                'help': self.config.OUTPUT_HELP
+            }),
+            (('--format',), {
+                'default': self.config.DEFAULT_OUTPUT_FORMAT,
+                'choices': output_formats,
+                'help': self.config.FORMAT_HELP
+            }),
+        ]
+    
+    def _get_logging_argument_specs(self) -> List[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+        """Get (flags, options) pairs for the mutually exclusive logging arguments."""
+        return [
+            (('-v', '--verbose'), {
+                'action': 'store_true',
+                'help': 'Enable verbose output'
+            }),
+            (('-q', '--quiet'), {
+                'action': 'store_true',
+                'help': 'Suppress non-error output'
+            }),
+        ]
+    
+    def _format_choices(self) -> Tuple[str, ...]:
+        """Get supported output formats for the --format option."""
+        # Imported here so that argparse setup alone does not load the exporters
+        from ..data.exporters.exporter_factory import DataExporterFactory
+        return DataExporterFactory.get_supported_formats()
+    
     def parse(self, args: Optional[List[str]] = None) -> ParsedArguments:
         """
         Parse command line arguments.
@@ -98,10 +114,6 @@ class ArgumentParser:
         """
         parsed = self.parser.parse_args(args)
         
-        # Validate argument combinations
-        if parsed.verbose and parsed.quiet:
-            self.parser.error("--verbose and --quiet are mutually exclusive")
-        
         return ParsedArguments(
             students_file=parsed.students,
             rooms_file=parsed.rooms,
@@ -111,9 +123,9 @@ class ArgumentParser:
             quiet=parsed.quiet
         )
     
-    def _get_epilog(self) -> str:
+    def _get_epilog(self, output_formats: Tuple[str, ...]) -> str:
         """Get epilog text for help message."""
-        supported_formats = ', '.join(DataExporterFactory.get_supported_formats())
+        supported_formats = ', '.join(output_formats)
         return f"""
 Examples:
   {self.config.PROGRAM_NAME} --students data/students.json --rooms data/rooms.json
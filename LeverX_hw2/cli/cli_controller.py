@@ -1,15 +1,18 @@
 """CLI controller orchestrating the application flow."""
+import os
 import sys
 import logging
-from typing import Optional, List
+from functools import cached_property
+from typing import Iterable, Optional, List
 
 from .argument_parser import ArgumentParser, ParsedArguments
 from .cli_config import CLIConfig
+from ..config.settings import APP_CONFIG
 from ..data.loaders.loader_factory import DataLoaderFactory
 from ..data.exporters.exporter_factory import DataExporterFactory
-from ..services.room_student_service import RoomStudentService
+from ..services.room_student_service import get_default_service
 from ..exceptions.custom_exceptions import (
-    StudentRoomManagerError,
+    CLI_ERROR_PREFIX,
     DataLoadError,
     DataExportError,
     UnsupportedFormatError,
@@ -23,9 +26,13 @@ class CLIController:
     
     def __init__(self, config: CLIConfig = None):
         self.config = config or CLIConfig()
-        self.argument_parser = ArgumentParser(self.config)
         self.logger = None  # Will be initialized after parsing args
     
+    @cached_property
+    def argument_parser(self) -> ArgumentParser:
+        """Argument parser, built on first use."""
+        return ArgumentParser(self.config)
+    
     def run(self, args: Optional[List[str]] = None) -> int:
         """
         Execute the CLI application.
@@ -36,6 +43,13 @@ class CLIController:
         Returns:
             Exit code (0 for success, non-zero for failure)
         """
+        argv = sys.argv[1:] if args is None else args
+        
+        # Answer --version without building the argument parser
+        if len(argv) == 1 and argv[0] in self.config.VERSION_FLAGS:
+            print(f"{self.config.PROGRAM_NAME} {self.config.PROGRAM_VERSION}")
+            return 0
+        
         try:
             # Parse command line arguments
             parsed_args = self.argument_parser.parse(args)
@@ -73,14 +87,18 @@ class CLIController:
     
     def _execute_application(self, args: ParsedArguments) -> None:
         """Execute the main application logic."""
-        self.logger.info(f"Starting {self.config.PROGRAM_NAME} v{self.config.PROGRAM_VERSION}")
-        self.logger.debug(f"Arguments: {args}")
+        self.logger.info("Starting %s v%s", self.config.PROGRAM_NAME, self.config.PROGRAM_VERSION)
+        self.logger.debug("Arguments: %s", args)
         
-        # Load data
-        students_data, rooms_data = self._load_input_data(args)
-        
-        # Process data
-        combined_data = self._process_data(students_data, rooms_data)
+        if self._should_stream_input(args):
+            # Combine students as they are parsed instead of loading them all first
+            combined_data = self._load_and_process_streaming(args)
+        else:
+            # Load data
+            students_data, rooms_data = self._load_input_data(args)
+            
+            # Process data
+            combined_data = self._process_data(students_data, rooms_data)
         
         # Export results
         self._export_data(combined_data, args)
@@ -92,10 +110,10 @@ class CLIController:
         try:
             loader = DataLoaderFactory.create_loader('json')
             
-            self.logger.info(f"Loading students from: {args.students_file}")
+            self.logger.info("Loading students from: %s", args.students_file)
             students_data = loader.load_students(args.students_file)
             
-            self.logger.info(f"Loading rooms from: {args.rooms_file}")
+            self.logger.info("Loading rooms from: %s", args.rooms_file)
             rooms_data = loader.load_rooms(args.rooms_file)
             
             return students_data, rooms_data
@@ -105,28 +123,67 @@ class CLIController:
         except Exception as e:
             raise DataLoadError(f"Unexpected error during data loading: {e}")
     
-    def _process_data(self, students_data: List, rooms_data: List) -> List:
-        """Process and combine the loaded data."""
+    def _process_data(self, students_data: List, rooms_data: List) -> Iterable:
+        """Validate and group the loaded data; combined rooms are built as they are exported."""
+        try:
+            service = get_default_service()
+            
+            self.logger.info("Processing and combining data...")
+            # The exporter logs the record count once it has written them all
+            return service.iter_combined_rooms(students_data, rooms_data)
+            
+        except ValidationError as e:
+            raise ValidationError(f"Data processing failed: {e}")
+        except Exception as e:
+            raise ValidationError(f"Unexpected error during data processing: {e}")
+    
+    def _should_stream_input(self, args: ParsedArguments) -> bool:
+        """Check whether the students file is large enough to stream."""
         try:
-            service = RoomStudentService()
+            size = os.path.getsize(args.students_file)
+        except OSError:
+            # Let the regular loading path report the problem
+            return False
+        return size > APP_CONFIG.STREAM_INPUT_THRESHOLD_BYTES
+    
+    def _load_and_process_streaming(self, args: ParsedArguments) -> List:
+        """Load rooms, then combine students while reading them incrementally."""
+        try:
+            loader = DataLoaderFactory.create_loader('json')
+            
+            self.logger.info("Loading rooms from: %s", args.rooms_file)
+            rooms_data = loader.load_rooms(args.rooms_file)
+            
+            self.logger.info("Streaming students from: %s", args.students_file)
+            students = loader.iter_students(args.students_file)
+        except DataLoadError as e:
+            raise DataLoadError(f"Failed to load input data: {e}")
+        except Exception as e:
+            raise DataLoadError(f"Unexpected error during data loading: {e}")
+        
+        try:
+            service = get_default_service()
             
             self.logger.info("Processing and combining data...")
-            combined_data = service.combine_data(students_data, rooms_data)
+            # iter_students validates each record, so the service only checks IDs
+            combined_data = service.combine_stream(students, rooms_data, records_validated=True)
             
-            self.logger.debug(f"Generated {len(combined_data)} combined room records")
+            self.logger.debug("Generated %d combined room records", len(combined_data))
             return combined_data
             
+        except DataLoadError as e:
+            raise DataLoadError(f"Failed to load input data: {e}")
         except ValidationError as e:
             raise ValidationError(f"Data processing failed: {e}")
         except Exception as e:
             raise ValidationError(f"Unexpected error during data processing: {e}")
     
-    def _export_data(self, data: List, args: ParsedArguments) -> None:
+    def _export_data(self, data: Iterable, args: ParsedArguments) -> None:
         """Export processed data to the specified format."""
         try:
             exporter = DataExporterFactory.create_exporter(args.output_format)
             
-            self.logger.info(f"Exporting data in {args.output_format.upper()} format to: {args.output_file}")
+            self.logger.info("Exporting data in %s format to: %s", args.output_format.upper(), args.output_file)
             exporter.export(data, args.output_file)
             
         except DataExportError as e:
@@ -138,24 +195,14 @@ class CLIController:
     
     def _handle_error(self, error: Exception) -> None:
         """Handle and display errors appropriately."""
-        error_prefix = "❌ Error:"
-        
-        if isinstance(error, DataLoadError):
-            print(f"{error_prefix} {error}", file=sys.stderr)
-            if error.file_path:
-                print(f"   File: {error.file_path}", file=sys.stderr)
-        elif isinstance(error, DataExportError):
-            print(f"{error_prefix} {error}", file=sys.stderr)
-            if error.output_path:
-                print(f"   Output: {error.output_path}", file=sys.stderr)
-        elif isinstance(error, ValidationError):
-            print(f"{error_prefix} {error}", file=sys.stderr)
-        elif isinstance(error, UnsupportedFormatError):
-            print(f"{error_prefix} {error}", file=sys.stderr)
-        elif isinstance(error, StudentRoomManagerError):
-            print(f"{error_prefix} {error}", file=sys.stderr)
+        # Application errors know how to describe themselves
+        cli_format = getattr(error, 'cli_format', None)
+        if cli_format is not None:
+            lines = cli_format()
         else:
-            print(f"{error_prefix} Unexpected error: {error}", file=sys.stderr)
+            lines = [f"{CLI_ERROR_PREFIX} Unexpected error: {error}"]
+        
+        print('\n'.join(lines), file=sys.stderr)
         
         # Log full traceback in debug mode
         if self.logger and self.logger.isEnabledFor(logging.DEBUG):
@@ -1,15 +1,13 @@
 """Application settings and configuration."""
-from dataclasses import dataclass
-from typing import Dict, List
+from typing import Optional, Tuple
 
 
-@dataclass
 class AppConfig:
     """Application configuration settings."""
     
     # Supported formats
-    SUPPORTED_LOADER_FORMATS: List[str] = None
-    SUPPORTED_EXPORTER_FORMATS: List[str] = None
+    SUPPORTED_LOADER_FORMATS: Tuple[str, ...] = ("json",)
+    SUPPORTED_EXPORTER_FORMATS: Tuple[str, ...] = ("json", "xml")
     
     # Default values
     DEFAULT_OUTPUT_FORMAT: str = "json"
@@ -19,16 +17,15 @@ class AppConfig:
     VALIDATE_INPUT_DATA: bool = True
     VALIDATE_OUTPUT_DATA: bool = True
     
+    # Write buffer for exported files, so large outputs need few write calls
+    EXPORT_BUFFER_SIZE: int = 1024 * 1024
+    
+    # Students files larger than this are read incrementally
+    STREAM_INPUT_THRESHOLD_BYTES: int = 64 * 1024 * 1024
+    
     # Logging settings
     LOG_LEVEL: str = "INFO"
-    LOG_FILE: str = None
-    
-    def __post_init__(self):
-        if self.SUPPORTED_LOADER_FORMATS is None:
-            self.SUPPORTED_LOADER_FORMATS = ["json"]
-        
-        if self.SUPPORTED_EXPORTER_FORMATS is None:
-            self.SUPPORTED_EXPORTER_FORMATS = ["json", "xml"]
+    LOG_FILE: Optional[str] = None
 
 
 # Global configuration instance
@@ -1,46 +1,60 @@
 """Factory for creating data exporters."""
-from typing import Dict, Type, List
+from importlib import import_module
+from typing import Dict, Type, Tuple
 from ...interfaces.data_exporter_interface import DataExporterInterface
 from ...exceptions.custom_exceptions import UnsupportedFormatError
-from .json_exporter import JSONExporter
-from .xml_exporter import XMLExporter
 
 
 class DataExporterFactory:
     """Factory for creating appropriate data exporter instances."""
     
-    _exporters: Dict[str, Type[DataExporterInterface]] = {
-        'json': JSONExporter,
-        'xml': XMLExporter,
+    # Built-in exporters as (module, class name); imported on first use
+    _builtin_exporters: Dict[str, Tuple[str, str]] = {
+        'json': ('.json_exporter', 'JSONExporter'),
+        'xml': ('.xml_exporter', 'XMLExporter'),
     }
     
+    _exporters: Dict[str, Type[DataExporterInterface]] = {}
+    
+    _supported_formats: Tuple[str, ...] = tuple(_builtin_exporters)
+    
+    # Exporters hold no per-call state, so one instance per format is shared
+    _instances: Dict[str, DataExporterInterface] = {}
+    
     @classmethod
     def create_exporter(cls, format_name: str) -> DataExporterInterface:
         """
         Create a data exporter for the specified format.
         
+        The same instance is returned for every call with a given format, so
+        exporters must not keep per-call state on the instance; paths and
+        other inputs are passed to their methods instead.
+        
         Args:
             format_name: Format name (e.g., 'json', 'xml')
             
         Returns:
-            DataExporterInterface implementation
+            Shared DataExporterInterface implementation
             
         Raises:
             UnsupportedFormatError: If format is not supported
         """
         format_lower = format_name.lower()
-        exporter_class = cls._exporters.get(format_lower)
+        instance = cls._instances.get(format_lower)
         
-        if not exporter_class:
-            supported = list(cls._exporters.keys())
-            raise UnsupportedFormatError(format_name, supported)
+        if instance is None:
+            exporter_class = cls._exporters.get(format_lower)
+            if exporter_class is None:
+                exporter_class = cls._import_builtin_exporter(format_name)
+            
+            instance = cls._instances[format_lower] = exporter_class()
         
-        return exporter_class()
+        return instance
     
     @classmethod
-    def get_supported_formats(cls) -> List[str]:
-        """Get list of supported exporter formats."""
-        return list(cls._exporters.keys())
+    def get_supported_formats(cls) -> Tuple[str, ...]:
+        """Get supported exporter formats."""
+        return cls._supported_formats
     
     @classmethod
     def register_exporter(cls, format_name: str, exporter_class: Type[DataExporterInterface]) -> None:
@@ -51,4 +65,22 @@ class DataExporterFactory:
             format_name: Format name
             exporter_class: Exporter class implementing DataExporterInterface
         """
-        cls._exporters[format_name.lower()] = exporter_class
+        format_lower = format_name.lower()
+        cls._exporters[format_lower] = exporter_class
+        cls._instances.pop(format_lower, None)
+        if format_lower not in cls._supported_formats:
+            cls._supported_formats += (format_lower,)
+    
+    @classmethod
+    def _import_builtin_exporter(cls, format_name: str) -> Type[DataExporterInterface]:
+        """Import a built-in exporter class and cache it for later calls."""
+        format_lower = format_name.lower()
+        location = cls._builtin_exporters.get(format_lower)
+        
+        if location is None:
+            raise UnsupportedFormatError(format_name, list(cls._supported_formats))
+        
+        module_name, class_name = location
+        exporter_class = getattr(import_module(module_name, __package__), class_name)
+        cls._exporters[format_lower] = exporter_class
+        return exporter_class
@@ -1,23 +1,30 @@
 """JSON data exporter implementation."""
 import json
 import logging
-from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, TextIO
 
 from ...interfaces.data_exporter_interface import DataExporterInterface
-from ...exceptions.custom_exceptions import DataExportError
+from ...config.settings import APP_CONFIG
+from ...exceptions.custom_exceptions import DataExportError, ValidationError
+from ...utils.file_utils import open_output_file
+from ...utils.validation import validate_combined_rooms_data, iter_valid_combined_rooms
+
+
+logger = logging.getLogger(__name__)
 
 
 class JSONExporter(DataExporterInterface):
     """JSON implementation of the data exporter interface."""
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
-    def export(self, data: List[Dict[str, Any]], output_path: str) -> None:
+    def export(self, data: Iterable[Dict[str, Any]], output_path: str) -> None:
         """
         Export data to JSON format.
         
+        A list is validated as a whole before anything is written. Any other
+        iterable, such as RoomStudentService.iter_combined_rooms, is validated
+        record by record while it is written. Either way the output file is
+        only replaced once the export has succeeded.
+        
         Args:
             data: Data to export
             output_path: Path where to save the JSON file
@@ -26,21 +33,49 @@ class JSONExporter(DataExporterInterface):
             DataExportError: If export fails
         """
         try:
-            self.logger.info(f"Exporting data to JSON: {output_path}")
+            logger.info("Exporting data to JSON: %s", output_path)
+            
+            if isinstance(data, list):
+                self.validate_output_data(data)
+            elif APP_CONFIG.VALIDATE_OUTPUT_DATA:
+                data = iter_valid_combined_rooms(data)
             
-            if self.validate_output_data(data):
-                # Ensure directory exists
-                output_path_obj = Path(output_path)
-                output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_path_obj, 'w', encoding='utf-8') as file:
-                    json.dump(data, file, ensure_ascii=False, indent=2)
-                
-                self.logger.info(f"Successfully exported {len(data)} records to JSON")
+            with open_output_file(output_path, buffering=APP_CONFIG.EXPORT_BUFFER_SIZE) as file:
+                count = self._write_records(data, file)
+            
+            logger.info("Successfully exported %d records to JSON", count)
             
         except Exception as e:
             raise DataExportError(f"Failed to export JSON data: {e}", output_path)
     
+    def _write_records(self, data: Iterable[Dict[str, Any]], file: TextIO) -> int:
+        """
+        Write records as a JSON array, one record at a time.
+        
+        Produces the same output as ``json.dump(list(data), file, indent=2)``
+        without encoding the whole list into memory at once. Any iterable of
+        records is accepted, so results can be written as they are produced.
+        
+        Args:
+            data: Records to write
+            file: Open text file to write to
+            
+        Returns:
+            Number of records written
+        """
+        write = file.write
+        
+        count = 0
+        for record in data:
+            write(',\n  ' if count else '[\n  ')
+            # Encoded JSON never contains raw newlines inside strings,
+            # so re-indenting the record by one level is a plain replace
+            write(json.dumps(record, ensure_ascii=False, indent=2).replace('\n', '\n  '))
+            count += 1
+        
+        write('\n]' if count else '[]')
+        return count
+    
     def get_file_extension(self) -> str:
         """Get JSON file extension."""
         return '.json'
@@ -58,18 +93,12 @@ class JSONExporter(DataExporterInterface):
         Raises:
             DataExportError: If validation fails
         """
-        if not isinstance(data, list):
-            raise DataExportError("Data must be a list for JSON export")
+        if not APP_CONFIG.VALIDATE_OUTPUT_DATA:
+            return True
         
-        # Validate each record
-        for i, record in enumerate(data):
-            if not isinstance(record, dict):
-                raise DataExportError(f"Record at index {i} must be a dictionary")
-            
-            # Check for required fields
-            required_fields = ['id', 'name', 'students']
-            for field in required_fields:
-                if field not in record:
-                    raise DataExportError(f"Record at index {i} missing required field: {field}")
+        try:
+            validate_combined_rooms_data(data, 'JSON')
+        except ValidationError as e:
+            raise DataExportError(str(e))
         
         return True
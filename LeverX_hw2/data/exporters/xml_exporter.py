@@ -1,24 +1,33 @@
 """XML data exporter implementation."""
+import io
 import logging
-from pathlib import Path
-from typing import List, Dict, Any
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from typing import List, Dict, Any, Iterable, TextIO
+from xml.sax.saxutils import escape
 
 from ...interfaces.data_exporter_interface import DataExporterInterface
-from ...exceptions.custom_exceptions import DataExportError
+from ...config.settings import APP_CONFIG
+from ...exceptions.custom_exceptions import DataExportError, ValidationError
+from ...utils.file_utils import open_output_file
+from ...utils.validation import validate_combined_rooms_data, iter_valid_combined_rooms
+
+
+logger = logging.getLogger(__name__)
+
+_XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
 
 
 class XMLExporter(DataExporterInterface):
     """XML implementation of the data exporter interface."""
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
-    def export(self, data: List[Dict[str, Any]], output_path: str) -> None:
+    def export(self, data: Iterable[Dict[str, Any]], output_path: str) -> None:
         """
         Export data to XML format.
         
+        A list is validated as a whole before anything is written. Any other
+        iterable, such as RoomStudentService.iter_combined_rooms, is validated
+        record by record while it is written. Either way the output file is
+        only replaced once the export has succeeded.
+        
         Args:
             data: Data to export
             output_path: Path where to save the XML file
@@ -27,19 +36,17 @@ class XMLExporter(DataExporterInterface):
             DataExportError: If export fails
         """
         try:
-            self.logger.info(f"Exporting data to XML: {output_path}")
+            logger.info("Exporting data to XML: %s", output_path)
+            
+            if isinstance(data, list):
+                self.validate_output_data(data)
+            elif APP_CONFIG.VALIDATE_OUTPUT_DATA:
+                data = iter_valid_combined_rooms(data)
+            
+            with open_output_file(output_path, buffering=APP_CONFIG.EXPORT_BUFFER_SIZE) as file:
+                count = self._write_xml(data, file)
             
-            if self.validate_output_data(data):
-                xml_content = self._generate_xml(data)
-                
-                # Ensure directory exists
-                output_path_obj = Path(output_path)
-                output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_path_obj, 'w', encoding='utf-8') as file:
-                    file.write(xml_content)
-                
-                self.logger.info(f"Successfully exported {len(data)} records to XML")
+            logger.info("Successfully exported %d records to XML", count)
             
         except Exception as e:
             raise DataExportError(f"Failed to export XML data: {e}", output_path)
@@ -61,17 +68,13 @@ class XMLExporter(DataExporterInterface):
         Raises:
             DataExportError: If validation fails
         """
-        if not isinstance(data, list):
-            raise DataExportError("Data must be a list for XML export")
+        if not APP_CONFIG.VALIDATE_OUTPUT_DATA:
+            return True
         
-        for i, record in enumerate(data):
-            if not isinstance(record, dict):
-                raise DataExportError(f"Record at index {i} must be a dictionary")
-            
-            required_fields = ['id', 'name', 'students']
-            for field in required_fields:
-                if field not in record:
-                    raise DataExportError(f"Record at index {i} missing required field: {field}")
+        try:
+            validate_combined_rooms_data(data, 'XML')
+        except ValidationError as e:
+            raise DataExportError(str(e))
         
         return True
     
@@ -79,60 +82,68 @@ class XMLExporter(DataExporterInterface):
         """
         Generate XML content from data.
         
+        export() writes straight to the output file instead; this is kept
+        for callers that want the document as a string.
+        
         Args:
             data: Data to convert to XML
             
         Returns:
             Formatted XML string
         """
-        root = Element('rooms')
-        
-        for room_data in data:
-            room_element = SubElement(root, 'room')
-            
-            # Room ID
-            id_element = SubElement(room_element, 'id')
-            room_id = room_data.get('id')
-            id_element.text = str(room_id) if room_id is not None else ''
-            
-            # Room name
-            name_element = SubElement(room_element, 'name')
-            name_element.text = self._escape_xml_content(str(room_data.get('name', '')))
-            
-            # Students
-            students_element = SubElement(room_element, 'students')
-            for student in room_data.get('students', []):
-                student_element = SubElement(students_element, 'student')
-                
-                student_id_element = SubElement(student_element, 'id')
-                student_id_element.text = str(student.get('id', ''))
-                
-                student_name_element = SubElement(student_element, 'name')
-                student_name_element.text = self._escape_xml_content(str(student.get('name', '')))
-        
-        # Pretty print
-        rough_string = tostring(root, encoding='utf-8')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent='  ')
+        buffer = io.StringIO()
+        self._write_xml(data, buffer)
+        return buffer.getvalue()
     
-    def _escape_xml_content(self, content: str) -> str:
+    def _write_xml(self, data: Iterable[Dict[str, Any]], file: TextIO) -> int:
         """
-        Escape XML special characters.
+        Write formatted XML for the fixed rooms/students schema.
+        
+        The document shape is known in advance, so it is written directly as
+        text rather than built as an ElementTree first. Any iterable of rooms
+        is accepted, so results can be written as they are produced.
         
         Args:
-            content: Content to escape
+            data: Data to convert to XML
+            file: Open text file to write to
             
         Returns:
-            Escaped content
+            Number of rooms written
         """
-        if not isinstance(content, str):
-            content = str(content)
+        write = file.write
+        write(_XML_DECLARATION)
         
-        # Basic XML escaping
-        content = content.replace('&', '&amp;')
-        content = content.replace('<', '&lt;')
-        content = content.replace('>', '&gt;')
-        content = content.replace('"', '&quot;')
-        content = content.replace("'", '&apos;')
+        count = 0
+        for room_data in data:
+            if not count:
+                write('<rooms>\n')
+            count += 1
+            
+            room_id = room_data.get('id')
+            write('  <room>\n')
+            write(_text_element('    ', 'id', str(room_id) if room_id is not None else ''))
+            write(_text_element('    ', 'name', str(room_data.get('name', ''))))
+            
+            students = room_data.get('students', [])
+            if not students:
+                write('    <students />\n')
+            else:
+                write('    <students>\n')
+                for student in students:
+                    write('      <student>\n')
+                    write(_text_element('        ', 'id', str(student.get('id', ''))))
+                    write(_text_element('        ', 'name', str(student.get('name', ''))))
+                    write('      </student>\n')
+                write('    </students>\n')
+            
+            write('  </room>\n')
         
-        return content
\ No newline at end of file
+        write('</rooms>\n' if count else '<rooms />\n')
+        return count
+
+
+def _text_element(indent: str, tag: str, text: str) -> str:
+    """Format a single indented text-only element, escaping its content."""
+    if not text:
+        return f'{indent}<{tag} />\n'
+    return f'{indent}<{tag}>{escape(text)}</{tag}>\n'
@@ -1,20 +1,37 @@
 """JSON data loader implementation."""
 import json
 import logging
-from pathlib import Path
-from typing import List, Dict, Any
+from itertools import chain
+from typing import List, Dict, Any, Iterator
+
+try:
+    import ijson
+except ImportError:  # optional dependency, only used for incremental loading
+    ijson = None
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so both
+    # parsers are handled by the same except clauses below
+    from orjson import loads as _json_loads
+except ImportError:  # optional dependency, faster parsing of whole files
+    _json_loads = json.loads
 
 from ...interfaces.data_loader_interface import DataLoaderInterface
 from ...exceptions.custom_exceptions import DataLoadError, ValidationError
-from ...utils.validation import validate_file_path, validate_students_data, validate_rooms_data
+from ...utils.validation import (
+    validate_file_path,
+    validate_students_data,
+    validate_rooms_data,
+    validate_student_record
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class JSONDataLoader(DataLoaderInterface):
     """JSON implementation of the data loader interface."""
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
     def load_students(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Load students data from JSON file.
@@ -31,24 +48,73 @@ class JSONDataLoader(DataLoaderInterface):
         validate_file_path(file_path)
         
         try:
-            self.logger.info(f"Loading students from: {file_path}")
-            
-            file_path_obj = Path(file_path)
-            if not file_path_obj.exists():
-                raise DataLoadError(f"Students file not found: {file_path}", file_path)
+            logger.info("Loading students from: %s", file_path)
             
-            with open(file_path_obj, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            with open(file_path, 'rb') as file:
+                data = _json_loads(file.read())
             
             if self.validate_data_format(data, 'students'):
-                self.logger.info(f"Successfully loaded {len(data)} students")
+                logger.info("Successfully loaded %d students", len(data))
                 return data
             
+        except FileNotFoundError:
+            raise DataLoadError(f"Students file not found: {file_path}", file_path)
         except json.JSONDecodeError as e:
             raise DataLoadError(f"Invalid JSON format in students file: {e}", file_path)
         except Exception as e:
             raise DataLoadError(f"Failed to load students data: {e}", file_path)
     
+    def iter_students(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over students from a JSON file without loading it all at once.
+        
+        Falls back to load_students when ijson is not installed.
+        
+        Args:
+            file_path: Path to the JSON file containing students data
+            
+        Returns:
+            Iterator over validated student dictionaries
+            
+        Raises:
+            DataLoadError: If file cannot be loaded or parsed, or if the
+                data is not a list of valid student records
+        """
+        if ijson is None:
+            return iter(self.load_students(file_path))
+        
+        validate_file_path(file_path)
+        return self._iter_students_incremental(file_path)
+    
+    def _iter_students_incremental(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield student records parsed incrementally with ijson."""
+        logger.info("Streaming students from: %s", file_path)
+        
+        try:
+            with open(file_path, 'rb') as file:
+                events = ijson.parse(file, use_float=True)
+                
+                # ijson.items only looks inside a top-level array, so any other
+                # top-level value has to be rejected here, as load_students does
+                first_event = next(events)
+                if first_event[1] != 'start_array':
+                    raise ValidationError("Students data must be a list")
+                
+                count = 0
+                for count, student in enumerate(ijson.items(chain((first_event,), events), 'item'), 1):
+                    validate_student_record(student, count - 1)
+                    yield student
+        except FileNotFoundError:
+            raise DataLoadError(f"Students file not found: {file_path}", file_path)
+        except ijson.JSONError as e:
+            raise DataLoadError(f"Invalid JSON format in students file: {e}", file_path)
+        except DataLoadError:
+            raise
+        except Exception as e:
+            raise DataLoadError(f"Failed to load students data: {e}", file_path)
+        
+        logger.info("Successfully loaded %d students", count)
+    
     def load_rooms(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Load rooms data from JSON file.
@@ -65,19 +131,17 @@ class JSONDataLoader(DataLoaderInterface):
         validate_file_path(file_path)
         
         try:
-            self.logger.info(f"Loading rooms from: {file_path}")
-            
-            file_path_obj = Path(file_path)
-            if not file_path_obj.exists():
-                raise DataLoadError(f"Rooms file not found: {file_path}", file_path)
+            logger.info("Loading rooms from: %s", file_path)
             
-            with open(file_path_obj, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            with open(file_path, 'rb') as file:
+                data = _json_loads(file.read())
             
             if self.validate_data_format(data, 'rooms'):
-                self.logger.info(f"Successfully loaded {len(data)} rooms")
+                logger.info("Successfully loaded %d rooms", len(data))
                 return data
             
+        except FileNotFoundError:
+            raise DataLoadError(f"Rooms file not found: {file_path}", file_path)
         except json.JSONDecodeError as e:
             raise DataLoadError(f"Invalid JSON format in rooms file: {e}", file_path)
         except Exception as e:
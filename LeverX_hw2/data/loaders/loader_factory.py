@@ -1,44 +1,59 @@
 """Factory for creating data loaders."""
-from typing import Dict, Type, List
+from importlib import import_module
+from typing import Dict, Type, Tuple
 from ...interfaces.data_loader_interface import DataLoaderInterface
 from ...exceptions.custom_exceptions import UnsupportedFormatError
-from .json_loader import JSONDataLoader
 
 
 class DataLoaderFactory:
     """Factory for creating appropriate data loader instances."""
     
-    _loaders: Dict[str, Type[DataLoaderInterface]] = {
-        'json': JSONDataLoader,
+    # Built-in loaders as (module, class name); imported on first use
+    _builtin_loaders: Dict[str, Tuple[str, str]] = {
+        'json': ('.json_loader', 'JSONDataLoader'),
     }
     
+    _loaders: Dict[str, Type[DataLoaderInterface]] = {}
+    
+    _supported_formats: Tuple[str, ...] = tuple(_builtin_loaders)
+    
+    # Loaders hold no per-call state, so one instance per format is shared
+    _instances: Dict[str, DataLoaderInterface] = {}
+    
     @classmethod
     def create_loader(cls, format_name: str) -> DataLoaderInterface:
         """
         Create a data loader for the specified format.
         
+        The same instance is returned for every call with a given format, so
+        loaders must not keep per-call state on the instance; paths and
+        other inputs are passed to their methods instead.
+        
         Args:
             format_name: Format name (e.g., 'json')
             
         Returns:
-            DataLoaderInterface implementation
+            Shared DataLoaderInterface implementation
             
         Raises:
             UnsupportedFormatError: If format is not supported
         """
         format_lower = format_name.lower()
-        loader_class = cls._loaders.get(format_lower)
+        instance = cls._instances.get(format_lower)
         
-        if not loader_class:
-            supported = list(cls._loaders.keys())
-            raise UnsupportedFormatError(format_name, supported)
+        if instance is None:
+            loader_class = cls._loaders.get(format_lower)
+            if loader_class is None:
+                loader_class = cls._import_builtin_loader(format_name)
+            
+            instance = cls._instances[format_lower] = loader_class()
         
-        return loader_class()
+        return instance
     
     @classmethod
-    def get_supported_formats(cls) -> List[str]:
-        """Get list of supported loader formats."""
-        return list(cls._loaders.keys())
+    def get_supported_formats(cls) -> Tuple[str, ...]:
+        """Get supported loader formats."""
+        return cls._supported_formats
     
     @classmethod
     def register_loader(cls, format_name: str, loader_class: Type[DataLoaderInterface]) -> None:
@@ -49,6 +64,22 @@ class DataLoaderFactory:
             format_name: Format name
             loader_class: Loader class implementing DataLoaderInterface
         """
-        cls._loaders[format_name.lower()] = loader_class
-
-
+        format_lower = format_name.lower()
+        cls._loaders[format_lower] = loader_class
+        cls._instances.pop(format_lower, None)
+        if format_lower not in cls._supported_formats:
+            cls._supported_formats += (format_lower,)
+    
+    @classmethod
+    def _import_builtin_loader(cls, format_name: str) -> Type[DataLoaderInterface]:
+        """Import a built-in loader class and cache it for later calls."""
+        format_lower = format_name.lower()
+        location = cls._builtin_loaders.get(format_lower)
+        
+        if location is None:
+            raise UnsupportedFormatError(format_name, list(cls._supported_formats))
+        
+        module_name, class_name = location
+        loader_class = getattr(import_module(module_name, __package__), class_name)
+        cls._loaders[format_lower] = loader_class
+        return loader_class
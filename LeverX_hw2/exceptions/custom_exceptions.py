@@ -1,9 +1,15 @@
 from typing import List
 """Custom exception classes for the application."""
 
+CLI_ERROR_PREFIX = "❌ Error:"
+
+
 class StudentRoomManagerError(Exception):
     """Base exception for Student Room Manager application."""
-    pass
+    
+    def cli_format(self) -> List[str]:
+        """Get the lines to display for this error on the command line."""
+        return [f"{CLI_ERROR_PREFIX} {self}"]
 
 
 class DataLoadError(StudentRoomManagerError):
@@ -12,6 +18,13 @@ class DataLoadError(StudentRoomManagerError):
     def __init__(self, message: str, file_path: str = None):
         self.file_path = file_path
         super().__init__(message)
+    
+    def cli_format(self) -> List[str]:
+        """Get the lines to display for this error on the command line."""
+        lines = super().cli_format()
+        if self.file_path:
+            lines.append(f"   File: {self.file_path}")
+        return lines
 
 
 class DataExportError(StudentRoomManagerError):
@@ -20,6 +33,13 @@ class DataExportError(StudentRoomManagerError):
     def __init__(self, message: str, output_path: str = None):
         self.output_path = output_path
         super().__init__(message)
+    
+    def cli_format(self) -> List[str]:
+        """Get the lines to display for this error on the command line."""
+        lines = super().cli_format()
+        if self.output_path:
+            lines.append(f"   Output: {self.output_path}")
+        return lines
 
 
 class ValidationError(StudentRoomManagerError):
@@ -1,18 +1,18 @@
 """Data exporter interface definition."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 
 
 class DataExporterInterface(ABC):
     """Abstract interface for data export operations."""
     
     @abstractmethod
-    def export(self, data: List[Dict[str, Any]], output_path: str) -> None:
+    def export(self, data: Iterable[Dict[str, Any]], output_path: str) -> None:
         """
         Export data to specified format and location.
         
         Args:
-            data: Data to export
+            data: Data to export; any iterable of records, consumed once
             output_path: Path where to save the exported data
             
         Raises:
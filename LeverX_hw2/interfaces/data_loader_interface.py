@@ -1,6 +1,9 @@
 """Data loader interface definition."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Protocol
+from typing import List, Dict, Any, Iterator, Protocol
+
+from ..exceptions.custom_exceptions import DataLoadError, ValidationError
+from ..utils.validation import validate_students_data
 
 
 class DataLoaderInterface(ABC):
@@ -23,6 +26,34 @@ class DataLoaderInterface(ABC):
         """
         pass
     
+    def iter_students(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over students data from file.
+        
+        Loaders that can parse incrementally should override this; the
+        default loads the whole file with load_students. Implementations
+        must yield only records that pass validate_student_record, because
+        callers such as the CLI streaming path do not check them again.
+        
+        Args:
+            file_path: Path to the students data file
+            
+        Returns:
+            Iterator over validated student dictionaries
+            
+        Raises:
+            DataLoadError: If the data is not a list of valid student records
+        """
+        students = self.load_students(file_path)
+        
+        # load_students implementations are not required to validate
+        try:
+            validate_students_data(students)
+        except ValidationError as e:
+            raise DataLoadError(f"Failed to load students data: {e}", file_path)
+        
+        return iter(students)
+    
     @abstractmethod
     def load_rooms(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -1,11 +1,12 @@
 import sys
 from typing import List, Optional
-from .cli.cli_controller import CLIController
-from .exceptions.custom_exceptions import StudentRoomManagerError
 
 
 def main(args: Optional[List[str]] = None) -> int:
     try:
+        # Imported on call so importing this module stays cheap
+        from .cli.cli_controller import CLIController
+        
         controller = CLIController()
         result = controller.run(args)
         return result
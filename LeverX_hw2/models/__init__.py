@@ -1 +1,5 @@
-"""Data models package."""
\ No newline at end of file
+"""Data models package."""
+import sys
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular dataclasses
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -2,8 +2,10 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
+from . import DATACLASS_OPTIONS
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class CombinedRoom:
     """
     Combined room model containing room info and assigned students.
@@ -1,10 +1,11 @@
 """Room data model."""
 from dataclasses import dataclass
 from typing import Dict, Any
-from ..utils.validation import validate_positive_integer, validate_non_empty_string
+from . import DATACLASS_OPTIONS
+from ..exceptions.custom_exceptions import ValidationError
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Room:
     """
     Room data model with validation.
@@ -18,8 +19,14 @@ class Room:
     
     def __post_init__(self):
         """Validate room data after initialization."""
-        validate_positive_integer(self.id, "Room ID")
-        validate_non_empty_string(self.name, "Room name")
+        # Same checks as utils.validation, inlined for the construction hot path
+        room_id = self.id
+        if not isinstance(room_id, int) or room_id <= 0:
+            raise ValidationError(f"Room ID must be a positive integer, got: {room_id}")
+        
+        name = self.name
+        if not isinstance(name, str) or not name.strip():
+            raise ValidationError(f"Room name must be a non-empty string, got: {name}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert room to dictionary representation."""
@@ -1,10 +1,11 @@
 """Student data model."""
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
-from ..utils.validation import validate_positive_integer, validate_non_empty_string
+from . import DATACLASS_OPTIONS
+from ..exceptions.custom_exceptions import ValidationError
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Student:
     """
     Student data model with validation.
@@ -20,10 +21,18 @@ class Student:
     
     def __post_init__(self):
         """Validate student data after initialization."""
-        validate_positive_integer(self.id, "Student ID")
-        validate_non_empty_string(self.name, "Student name")
-        if self.room is not None:
-            validate_positive_integer(self.room, "Room ID")
+        # Same checks as utils.validation, inlined for the construction hot path
+        student_id = self.id
+        if not isinstance(student_id, int) or student_id <= 0:
+            raise ValidationError(f"Student ID must be a positive integer, got: {student_id}")
+        
+        name = self.name
+        if not isinstance(name, str) or not name.strip():
+            raise ValidationError(f"Student name must be a non-empty string, got: {name}")
+        
+        room = self.room
+        if room is not None and (not isinstance(room, int) or room <= 0):
+            raise ValidationError(f"Room ID must be a positive integer, got: {room}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert student to dictionary representation."""
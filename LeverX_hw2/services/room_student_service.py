@@ -1,18 +1,42 @@
 """Room-student business logic service."""
+import functools
 import logging
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import List, Dict, Any, FrozenSet, Iterable, Iterator, Optional
 
 from ..interfaces.service_interface import RoomStudentServiceInterface
-from ..models.combined_room import CombinedRoom
-from ..exceptions.custom_exceptions import ValidationError
+from ..exceptions.custom_exceptions import DataLoadError, ValidationError
 from ..utils.validation import validate_students_data, validate_rooms_data
 
 
+logger = logging.getLogger(__name__)
+
+
+def _combined_room_dict(room_id: Optional[int], name: str, students: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a combined room record; same shape as CombinedRoom.to_dict()."""
+    return {
+        'id': room_id,
+        'name': name,
+        'students': students
+    }
+
+
 class RoomStudentService(RoomStudentServiceInterface):
     """Service implementing room-student business logic."""
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, fast_path: bool = True, assume_unique_ids: bool = False):
+        """
+        Initialize the service.
+        
+        Args:
+            fast_path: Validate students while grouping them in a single
+                pass; set to False to run the full validate_input_data
+                checks before any grouping happens
+            assume_unique_ids: Skip the duplicate room/student ID checks;
+                for batch pipelines that already de-duplicate upstream
+        """
+        self.fast_path = fast_path
+        self.assume_unique_ids = assume_unique_ids
     
     def combine_data(self, students: List[Dict[str, Any]], rooms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -31,31 +55,77 @@ class RoomStudentService(RoomStudentServiceInterface):
         Returns:
             List of combined room dictionaries with assigned students
         """
-        self.logger.info(f"Combining {len(students)} students with {len(rooms)} rooms")
+        logger.info("Combining %d students with %d rooms", len(students), len(rooms))
+        
+        result = list(self.iter_combined_rooms(students, rooms))
         
-        # Validate input data
-        if self.validate_input_data(students, rooms):
-            self.logger.debug("Input data validation passed")
+        logger.info("Successfully combined data into %d room groups", len(result))
+        return result
+    
+    def iter_combined_rooms(self, students: List[Dict[str, Any]], rooms: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Combine students and rooms data, producing one combined room at a time.
+        
+        Follows the same business rules as combine_data. Validation and
+        grouping run before this returns, so invalid input raises right away;
+        only the combined room records are built lazily, which lets an
+        exporter write them out without a full result list.
+        
+        Args:
+            students: List of student data dictionaries
+            rooms: List of room data dictionaries
+            
+        Returns:
+            Iterator over combined room dictionaries
+        """
+        if self.fast_path:
+            if not isinstance(students, list):
+                raise ValidationError("Students data must be a list")
+            
+            valid_room_ids = self._validate_rooms(rooms)
+            
+            # Validate and group students in the same traversal
+            students_by_room, unassigned_students = self._validate_and_group(students, valid_room_ids)
+        else:
+            # Validate input data
+            self.validate_input_data(students, rooms)
+            
+            # Collect assignable room IDs for O(1) membership checks
+            valid_room_ids = self._build_valid_room_ids(rooms)
+            
+            # Group students by room assignment
+            students_by_room, unassigned_students = self._group_students_by_room(students, valid_room_ids)
         
-        # Build room lookup for efficient access
-        room_lookup = self._build_room_lookup(rooms)
+        return self._generate_combined_rooms(rooms, students_by_room, unassigned_students)
+    
+    def combine_stream(self, students: Iterable[Dict[str, Any]], rooms: List[Dict[str, Any]],
+                       records_validated: bool = False) -> List[Dict[str, Any]]:
+        """
+        Combine students and rooms data, consuming students one at a time.
         
-        # Group students by room assignment
-        students_by_room, unassigned_students = self._group_students_by_room(students, room_lookup)
+        Applies the same business rules and validation as combine_data, but
+        never needs the full students list in memory, so it can be fed
+        directly from an incremental loader.
         
-        # Build result with rooms and their assigned students
-        result = self._build_combined_rooms(rooms, students_by_room)
+        Args:
+            students: Iterable of student data dictionaries
+            rooms: List of room data dictionaries
+            records_validated: Skip the per-student structure checks because
+                the source (e.g. DataLoaderInterface.iter_students) has
+                already validated each record; duplicate IDs are still checked
+            
+        Returns:
+            List of combined room dictionaries with assigned students
+        """
+        logger.info("Combining streamed students with %d rooms", len(rooms))
         
-        # Add unassigned students if any exist
-        if unassigned_students:
-            unassigned_room = CombinedRoom(
-                id=None,
-                name='Unassigned Students',
-                students=unassigned_students
-            )
-            result.append(unassigned_room.to_dict())
+        valid_room_ids = self._validate_rooms(rooms)
+        students_by_room, unassigned_students = self._validate_and_group(
+            students, valid_room_ids, check_records=not records_validated
+        )
+        result = list(self._generate_combined_rooms(rooms, students_by_room, unassigned_students))
         
-        self.logger.info(f"Successfully combined data into {len(result)} room groups")
+        logger.info("Successfully combined data into %d room groups", len(result))
         return result
     
     def validate_input_data(self, students: List[Dict[str, Any]], rooms: List[Dict[str, Any]]) -> bool:
@@ -86,61 +156,155 @@ class RoomStudentService(RoomStudentServiceInterface):
         except Exception as e:
             raise ValidationError(f"Input validation failed: {e}")
     
-    def _build_room_lookup(self, rooms: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
-        """Build efficient room lookup dictionary."""
-        room_lookup = {}
-        for room in rooms:
-            room_id = room.get('id')
-            if room_id is not None:
-                room_lookup[room_id] = room
-        return room_lookup
+    def _validate_rooms(self, rooms: List[Dict[str, Any]]) -> FrozenSet[int]:
+        """Validate rooms data and collect the room IDs used for grouping."""
+        try:
+            validate_rooms_data(rooms)
+            if not self.assume_unique_ids:
+                self._check_unique_ids(rooms, 'room')
+            return self._build_valid_room_ids(rooms)
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise ValidationError(f"Input validation failed: {e}")
     
-    def _group_students_by_room(self, students: List[Dict[str, Any]], room_lookup: Dict[int, Dict[str, Any]]) -> tuple:
+    def _validate_and_group(self, students: Iterable[Dict[str, Any]], valid_room_ids: FrozenSet[int],
+                            check_records: bool = True) -> tuple:
+        """
+        Validate students and group them by room in a single pass.
+        
+        Performs the per-student checks of validate_students_data and the
+        duplicate student ID rule while bucketing, so the students are only
+        traversed once. With check_records=False only the duplicate ID rule
+        is applied, for records that were validated by their source.
+        
+        Raises:
+            ValidationError: On the first invalid or duplicate student, or if
+                a student cannot be grouped (e.g. an unhashable ID)
+        """
+        students_by_room = defaultdict(list)
+        unassigned_students = []
+        seen_ids = set()
+        check_ids = not self.assume_unique_ids
+        
+        # Bind hot-loop methods once instead of looking them up per student
+        add_unassigned = unassigned_students.append
+        add_seen = seen_ids.add
+        
+        try:
+            for i, student in enumerate(students):
+                if check_records:
+                    # Inlined validate_student_record checks
+                    if not isinstance(student, dict):
+                        raise ValidationError(f"Student at index {i} must be a dictionary")
+                    if 'id' not in student:
+                        raise ValidationError(f"Student at index {i} missing required 'id' field")
+                    if 'name' not in student:
+                        raise ValidationError(f"Student at index {i} missing required 'name' field")
+                
+                # 'id' and 'name' were checked above or by the source; 'room' is optional
+                student_id = student['id']
+                if check_ids and student_id is not None:
+                    if student_id in seen_ids:
+                        raise ValidationError("Duplicate student IDs found")
+                    add_seen(student_id)
+                
+                room_id = student.get('room')
+                student_data = {
+                    'id': student_id,
+                    'name': student['name']
+                }
+                
+                if room_id in valid_room_ids:
+                    students_by_room[room_id].append(student_data)
+                else:
+                    add_unassigned(student_data)
+        except (ValidationError, DataLoadError):
+            # DataLoadError comes from a streamed source and is reported as-is
+            raise
+        except Exception as e:
+            raise ValidationError(f"Input validation failed: {e}")
+        
+        return students_by_room, unassigned_students
+    
+    def _build_valid_room_ids(self, rooms: List[Dict[str, Any]]) -> FrozenSet[int]:
+        """Build the set of room IDs that students can be assigned to."""
+        return frozenset(room['id'] for room in rooms if room['id'] is not None)
+    
+    def _group_students_by_room(self, students: List[Dict[str, Any]], valid_room_ids: FrozenSet[int]) -> tuple:
         """Group students by their room assignment."""
-        students_by_room = {}
+        students_by_room = defaultdict(list)
         unassigned_students = []
         
+        # Bind hot-loop methods once instead of looking them up per student
+        add_unassigned = unassigned_students.append
+        
         for student in students:
+            # validate_input_data guarantees 'id' and 'name'; 'room' is optional
             room_id = student.get('room')
             student_data = {
-                'id': student.get('id'),
-                'name': student.get('name', 'Unknown')
+                'id': student['id'],
+                'name': student['name']
             }
             
-            if room_id is not None and room_id in room_lookup:
+            if room_id in valid_room_ids:
                 # Student assigned to existing room
-                if room_id not in students_by_room:
-                    students_by_room[room_id] = []
                 students_by_room[room_id].append(student_data)
             else:
                 # Student unassigned or assigned to non-existent room
-                unassigned_students.append(student_data)
+                add_unassigned(student_data)
         
         return students_by_room, unassigned_students
     
-    def _build_combined_rooms(self, rooms: List[Dict[str, Any]], students_by_room: Dict[int, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
-        """Build final combined room structures."""
-        result = []
+    def _generate_combined_rooms(self, rooms: List[Dict[str, Any]], students_by_room: Dict[int, List[Dict[str, Any]]],
+                                 unassigned_students: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield combined rooms in input order, then the unassigned group if it is not empty."""
+        room_students = students_by_room.get
         
+        # Rooms with their assigned students
         for room in rooms:
-            room_id = room.get('id')
-            combined_room = CombinedRoom(
-                id=room_id,
-                name=room.get('name', 'Unknown Room'),
-                students=students_by_room.get(room_id, [])
+            room_id = room['id']
+            yield _combined_room_dict(
+                room_id,
+                room['name'],
+                room_students(room_id) or []
             )
-            result.append(combined_room.to_dict())
         
-        return result
+        # Unassigned students if any exist
+        if unassigned_students:
+            yield _combined_room_dict(None, 'Unassigned Students', unassigned_students)
     
     def _validate_business_rules(self, students: List[Dict[str, Any]], rooms: List[Dict[str, Any]]) -> None:
         """Validate business-specific rules."""
-        # Check for duplicate room IDs
-        room_ids = [room.get('id') for room in rooms if room.get('id') is not None]
-        if len(room_ids) != len(set(room_ids)):
-            raise ValidationError("Duplicate room IDs found")
-        
-        # Check for duplicate student IDs
-        student_ids = [student.get('id') for student in students if student.get('id') is not None]
-        if len(student_ids) != len(set(student_ids)):
-            raise ValidationError("Duplicate student IDs found")
+        if self.assume_unique_ids:
+            return
+        
+        self._check_unique_ids(rooms, 'room')
+        self._check_unique_ids(students, 'student')
+    
+    def _check_unique_ids(self, records: List[Dict[str, Any]], label: str) -> None:
+        """Raise on the first repeated non-null 'id' in a single pass."""
+        seen = set()
+        add = seen.add
+        
+        for record in records:
+            record_id = record.get('id')
+            if record_id is None:
+                continue
+            if record_id in seen:
+                raise ValidationError(f"Duplicate {label} IDs found")
+            add(record_id)
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_service() -> RoomStudentService:
+    """
+    Get the shared RoomStudentService with default settings.
+    
+    The service keeps no per-call state, so one instance can serve every
+    invocation of the pipeline.
+    
+    Returns:
+        Cached RoomStudentService instance
+    """
+    return RoomStudentService()
@@ -0,0 +1,45 @@
+"""File output utility functions."""
+import os
+import shutil
+import uuid
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Iterator, TextIO
+
+
+@contextmanager
+def open_output_file(output_path: str, buffering: int = -1) -> Iterator[TextIO]:
+    """
+    Open a UTF-8 text file for writing that only replaces output_path on success.
+    
+    Content goes to a temporary file in the same directory, which is moved
+    over output_path once the block completes. If the block raises, the
+    temporary file is removed and any existing file at output_path is left
+    untouched.
+    
+    Args:
+        output_path: Path of the file to write
+        buffering: Buffer size passed to open()
+    
+    Yields:
+        Open text file to write the content to
+    """
+    path = Path(output_path)
+    
+    # Ensure directory exists
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_path, 'x', encoding='utf-8', newline='\n', buffering=buffering) as file:
+            yield file
+        
+        # Keep the permissions of a file that is being replaced
+        with suppress(FileNotFoundError):
+            shutil.copymode(path, temp_path)
+        
+        os.replace(temp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            temp_path.unlink()
+        raise
@@ -1,5 +1,5 @@
 """Validation utility functions."""
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Iterable, Iterator
 from ..exceptions.custom_exceptions import ValidationError
 
 
@@ -61,14 +61,28 @@ def validate_students_data(students: List[Dict[str, Any]]) -> None:
         raise ValidationError("Students data must be a list")
     
     for i, student in enumerate(students):
-        if not isinstance(student, dict):
-            raise ValidationError(f"Student at index {i} must be a dictionary")
-        
-        if 'id' not in student:
-            raise ValidationError(f"Student at index {i} missing required 'id' field")
+        validate_student_record(student, i)
+
+
+def validate_student_record(student: Any, index: int) -> None:
+    """
+    Validate a single student record.
+    
+    Args:
+        student: Student record to validate
+        index: Position of the record, used in error messages
         
-        if 'name' not in student:
-            raise ValidationError(f"Student at index {i} missing required 'name' field")
+    Raises:
+        ValidationError: If the record is invalid
+    """
+    if not isinstance(student, dict):
+        raise ValidationError(f"Student at index {index} must be a dictionary")
+    
+    if 'id' not in student:
+        raise ValidationError(f"Student at index {index} missing required 'id' field")
+    
+    if 'name' not in student:
+        raise ValidationError(f"Student at index {index} missing required 'name' field")
 
 
 def validate_rooms_data(rooms: List[Dict[str, Any]]) -> None:
@@ -93,3 +107,64 @@ def validate_rooms_data(rooms: List[Dict[str, Any]]) -> None:
         
         if 'name' not in room:
             raise ValidationError(f"Room at index {i} missing required 'name' field")
+
+
+COMBINED_ROOM_FIELDS = ('id', 'name', 'students')
+
+
+def validate_combined_rooms_data(rooms: List[Dict[str, Any]], format_name: str) -> None:
+    """
+    Validate combined rooms data structure before export.
+    
+    Args:
+        rooms: Combined rooms data to validate
+        format_name: Export format label used in error messages (e.g. 'JSON')
+        
+    Raises:
+        ValidationError: If data is invalid
+    """
+    if not isinstance(rooms, list):
+        raise ValidationError(f"Data must be a list for {format_name} export")
+    
+    for i, room in enumerate(rooms):
+        validate_combined_room_record(room, i)
+
+
+def validate_combined_room_record(room: Any, index: int) -> None:
+    """
+    Validate a single combined room record before export.
+    
+    Args:
+        room: Combined room record to validate
+        index: Position of the record, used in error messages
+        
+    Raises:
+        ValidationError: If the record is invalid
+    """
+    if not isinstance(room, dict):
+        raise ValidationError(f"Record at index {index} must be a dictionary")
+    
+    if 'id' not in room or 'name' not in room or 'students' not in room:
+        missing = next(field for field in COMBINED_ROOM_FIELDS if field not in room)
+        raise ValidationError(f"Record at index {index} missing required field: {missing}")
+
+
+def iter_valid_combined_rooms(rooms: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield combined room records, validating each one as it is consumed.
+    
+    Lets an exporter check records that are produced lazily, e.g. by
+    RoomStudentService.iter_combined_rooms, without collecting them first.
+    
+    Args:
+        rooms: Combined room records to validate
+        
+    Yields:
+        Each record, after it has passed validate_combined_room_record
+        
+    Raises:
+        ValidationError: On the first invalid record
+    """
+    for i, room in enumerate(rooms):
+        validate_combined_room_record(room, i)
+        yield room
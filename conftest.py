@@ -0,0 +1 @@
+"""Test configuration: makes the repo root importable so bare `pytest` finds LeverX_hw2."""
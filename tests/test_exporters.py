@@ -0,0 +1,62 @@
+"""Exporters write any iterable of combined rooms and fail without leftovers."""
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from LeverX_hw2.config.settings import APP_CONFIG
+from LeverX_hw2.data.exporters.json_exporter import JSONExporter
+from LeverX_hw2.data.exporters.xml_exporter import XMLExporter
+from LeverX_hw2.exceptions.custom_exceptions import DataExportError
+from LeverX_hw2.services.room_student_service import RoomStudentService
+
+
+STUDENTS = [{'id': 1, 'name': 'A', 'room': 1}, {'id': 2, 'name': 'B'}]
+ROOMS = [{'id': 1, 'name': 'Room #1'}, {'id': 2, 'name': 'Room #2'}]
+
+
+@pytest.mark.parametrize('validate', [True, False], ids=['validated', 'unvalidated'])
+def test_json_export_accepts_a_generator(tmp_path, monkeypatch, validate):
+    monkeypatch.setattr(APP_CONFIG, 'VALIDATE_OUTPUT_DATA', validate)
+    service = RoomStudentService()
+    output_file = tmp_path / 'out.json'
+
+    JSONExporter().export(service.iter_combined_rooms(STUDENTS, ROOMS), str(output_file))
+
+    assert json.loads(output_file.read_text(encoding='utf-8')) == service.combine_data(STUDENTS, ROOMS)
+
+
+@pytest.mark.parametrize('validate', [True, False], ids=['validated', 'unvalidated'])
+def test_xml_export_accepts_a_generator(tmp_path, monkeypatch, validate):
+    monkeypatch.setattr(APP_CONFIG, 'VALIDATE_OUTPUT_DATA', validate)
+    output_file = tmp_path / 'out.xml'
+
+    XMLExporter().export(RoomStudentService().iter_combined_rooms(STUDENTS, ROOMS), str(output_file))
+
+    rooms = ET.parse(output_file).getroot()
+    assert [room.findtext('name') for room in rooms] == ['Room #1', 'Room #2', 'Unassigned Students']
+
+
+EXPORTERS = pytest.mark.parametrize('exporter, name', [(JSONExporter(), 'JSON'), (XMLExporter(), 'XML')],
+                                     ids=['json', 'xml'])
+
+
+@EXPORTERS
+@pytest.mark.parametrize('as_list', [True, False], ids=['list', 'generator'])
+def test_invalid_record_keeps_the_existing_file(tmp_path, exporter, name, as_list):
+    records = [{'id': 1, 'name': 'Room #1', 'students': []}, {'id': 2}]
+    output_file = tmp_path / 'out'
+    output_file.write_text('previous export', encoding='utf-8')
+
+    with pytest.raises(DataExportError, match=f"^Failed to export {name} data: "
+                                              "Record at index 1 missing required field: name$"):
+        exporter.export(records if as_list else iter(records), str(output_file))
+
+    assert output_file.read_text(encoding='utf-8') == 'previous export'
+    assert [path.name for path in tmp_path.iterdir()] == ['out']
+
+
+@EXPORTERS
+def test_validate_output_data_keeps_the_baseline_message(exporter, name):
+    with pytest.raises(DataExportError, match=f"^Data must be a list for {name} export$"):
+        exporter.validate_output_data(iter([]))
@@ -0,0 +1,16 @@
+"""RoomStudentService error handling on the fast and strict paths."""
+import pytest
+
+from LeverX_hw2.exceptions.custom_exceptions import ValidationError
+from LeverX_hw2.services.room_student_service import RoomStudentService
+
+
+ROOMS = [{'id': 1, 'name': 'Room #1'}]
+
+
+@pytest.mark.parametrize('fast_path', [True, False], ids=['fast', 'strict'])
+def test_unhashable_student_id_is_a_validation_error(fast_path):
+    students = [{'id': [1], 'name': 'A', 'room': 1}]
+
+    with pytest.raises(ValidationError, match="Input validation failed: unhashable type: 'list'"):
+        RoomStudentService(fast_path=fast_path).combine_data(students, ROOMS)
@@ -0,0 +1,70 @@
+"""Streaming and batch loading must reject bad students files the same way."""
+import json
+
+import pytest
+
+from LeverX_hw2.cli.cli_controller import CLIController
+from LeverX_hw2.config.settings import APP_CONFIG
+from LeverX_hw2.exceptions.custom_exceptions import DataLoadError
+from LeverX_hw2.interfaces.data_loader_interface import DataLoaderInterface
+
+
+ROOMS = [{'id': 1, 'name': 'Room #1'}]
+
+
+def _run(tmp_path, students_content, monkeypatch, capsys, stream):
+    students_file = tmp_path / 'students.json'
+    students_file.write_text(students_content, encoding='utf-8')
+    rooms_file = tmp_path / 'rooms.json'
+    rooms_file.write_text(json.dumps(ROOMS), encoding='utf-8')
+    output_file = tmp_path / 'out.json'
+
+    threshold = -1 if stream else APP_CONFIG.STREAM_INPUT_THRESHOLD_BYTES
+    monkeypatch.setattr(APP_CONFIG, 'STREAM_INPUT_THRESHOLD_BYTES', threshold)
+
+    exit_code = CLIController().run([
+        '--students', str(students_file),
+        '--rooms', str(rooms_file),
+        '--out', str(output_file),
+        '--quiet'
+    ])
+    return exit_code, capsys.readouterr().err, output_file
+
+
+@pytest.mark.parametrize('stream', [False, True], ids=['batch', 'streaming'])
+@pytest.mark.parametrize('content', ['{"id": 1, "name": "A"}', '"hello"'], ids=['object', 'string'])
+def test_non_array_students_file_is_rejected(tmp_path, monkeypatch, capsys, stream, content):
+    exit_code, err, output_file = _run(tmp_path, content, monkeypatch, capsys, stream)
+
+    assert exit_code == 1
+    assert "Failed to load input data: Failed to load students data: Students data must be a list" in err
+    assert not output_file.exists()
+
+
+@pytest.mark.parametrize('stream', [False, True], ids=['batch', 'streaming'])
+def test_bad_student_record_is_a_load_error(tmp_path, monkeypatch, capsys, stream):
+    content = json.dumps([{'id': 1, 'name': 'A', 'room': 1}, {'id': 2}])
+    exit_code, err, output_file = _run(tmp_path, content, monkeypatch, capsys, stream)
+
+    assert exit_code == 1
+    assert ("Failed to load input data: Failed to load students data: "
+            "Student at index 1 missing required 'name' field") in err
+    assert not output_file.exists()
+
+
+class _UncheckedLoader(DataLoaderInterface):
+    """Loader whose load_students returns records without validating them."""
+
+    def load_students(self, file_path):
+        return [{'id': 1}]
+
+    def load_rooms(self, file_path):
+        return ROOMS
+
+    def validate_data_format(self, data, data_type):
+        return True
+
+
+def test_default_iter_students_validates_records():
+    with pytest.raises(DataLoadError, match="Student at index 0 missing required 'name' field"):
+        list(_UncheckedLoader().iter_students('students.json'))
@@ -0,0 +1,43 @@
+"""The hand-written XML output must stay well-formed and escape its text."""
+import xml.etree.ElementTree as ET
+
+from LeverX_hw2.data.exporters.xml_exporter import XMLExporter
+
+
+def _export(tmp_path, rooms):
+    output_file = tmp_path / 'out.xml'
+    XMLExporter().export(rooms, str(output_file))
+    return output_file.read_text(encoding='utf-8')
+
+
+ROOMS = [
+    {'id': 1, 'name': 'R&D <Lab> "A"', 'students': [{'id': 7, 'name': 'O\'Neil & Sons ]]>'}]},
+    {'id': 2, 'name': '', 'students': []},
+    {'id': None, 'name': 'Unassigned Students', 'students': [{'id': 8, 'name': '<b>'}]},
+]
+
+
+def test_text_is_escaped_and_round_trips(tmp_path):
+    root = ET.fromstring(_export(tmp_path, ROOMS).encode('utf-8'))
+
+    assert root.tag == 'rooms'
+    assert [room.findtext('name') for room in root] == ['R&D <Lab> "A"', '', 'Unassigned Students']
+    assert [room.findtext('id') for room in root] == ['1', '2', '']
+    assert [[student.findtext('name') for student in room.find('students')] for room in root] == [
+        ['O\'Neil & Sons ]]>'], [], ['<b>']
+    ]
+
+
+def test_empty_elements_are_self_closing(tmp_path):
+    xml = _export(tmp_path, ROOMS)
+
+    assert xml.startswith("<?xml version='1.0' encoding='utf-8'?>\n<rooms>\n")
+    assert '    <name />\n    <students />\n' in xml
+    assert '    <id />\n    <name>Unassigned Students</name>\n' in xml
+
+
+def test_no_rooms_is_an_empty_root(tmp_path):
+    xml = _export(tmp_path, [])
+
+    assert xml == "<?xml version='1.0' encoding='utf-8'?>\n<rooms />\n"
+    assert ET.fromstring(xml.encode('utf-8')).tag == 'rooms'